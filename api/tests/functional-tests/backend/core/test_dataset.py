@@ -92,6 +92,51 @@ def test_get_paginated_datasets(db: Session, created_datasets):
     assert set(combined) == set([f"dataset{i}" for i in range(0, 10)])
 
 
+def test_get_paginated_datasets_label_filter(db: Session):
+    # each dataset has a single annotation with two matching labels
+    for name in ["dataset0", "dataset1", "dataset2"]:
+        core.create_dataset(db, dataset=schemas.Dataset(name=name))
+        core.create_groundtruths(
+            db=db,
+            groundtruths=[
+                schemas.GroundTruth(
+                    dataset_name=name,
+                    datum=schemas.Datum(uid="uid1"),
+                    annotations=[
+                        schemas.Annotation(
+                            labels=[
+                                schemas.Label(key="k1", value="v1"),
+                                schemas.Label(key="k1", value="v2"),
+                            ],
+                        )
+                    ],
+                )
+            ],
+        )
+    core.set_dataset_status(db, "dataset2", enums.TableStatus.DELETING)
+
+    filters = schemas.Filter(
+        labels=schemas.Condition(
+            lhs=schemas.Symbol(name=schemas.SupportedSymbol.LABEL_KEY),
+            rhs=schemas.Value.infer("k1"),
+            op=schemas.FilterOperator.EQ,
+        ),
+    )
+
+    datasets, headers = core.get_paginated_datasets(db, filters=filters)
+    assert [dataset.name for dataset in datasets] == [
+        "dataset1",
+        "dataset0",
+    ]
+    assert headers == {"content-range": "items 0-1/2"}
+
+    datasets, headers = core.get_paginated_datasets(
+        db, filters=filters, offset=1, limit=5
+    )
+    assert [dataset.name for dataset in datasets] == ["dataset0"]
+    assert headers == {"content-range": "items 1-1/2"}
+
+
 def test_dataset_status(db: Session, created_dataset):
     # creating
     assert (
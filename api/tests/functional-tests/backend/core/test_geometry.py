@@ -317,7 +317,7 @@ def test_create_raster_from_polygons(
 
     # verify all rasters are equal
     raster_arrs = [
-        Raster(mask=_raster_to_png_b64(db, r)).to_numpy()
+        Raster(mask=_raster_to_png_b64(r)).to_numpy()
         for r in db.scalars(select(models.Annotation.raster)).all()
     ]
     assert len(raster_arrs) == 3
@@ -87,6 +87,48 @@ def test_get_paginated_models(db: Session, created_models):
     assert set(combined) == set([f"model{i}" for i in range(0, 10)])
 
 
+def test_get_paginated_models_label_filter(db: Session, created_dataset):
+    # each model has a single annotation with two matching labels
+    for name in ["model0", "model1"]:
+        core.create_model(db, model=schemas.Model(name=name))
+        core.create_predictions(
+            db=db,
+            predictions=[
+                schemas.Prediction(
+                    dataset_name=created_dataset,
+                    model_name=name,
+                    datum=schemas.Datum(uid="uid1"),
+                    annotations=[
+                        schemas.Annotation(
+                            labels=[
+                                schemas.Label(key="k1", value="v1", score=0.4),
+                                schemas.Label(key="k1", value="v2", score=0.6),
+                            ],
+                        )
+                    ],
+                )
+            ],
+        )
+
+    filters = schemas.Filter(
+        labels=schemas.Condition(
+            lhs=schemas.Symbol(name=schemas.SupportedSymbol.LABEL_KEY),
+            rhs=schemas.Value.infer("k1"),
+            op=schemas.FilterOperator.EQ,
+        ),
+    )
+
+    models, headers = core.get_paginated_models(db, filters=filters)
+    assert [model.name for model in models] == ["model1", "model0"]
+    assert headers == {"content-range": "items 0-1/2"}
+
+    models, headers = core.get_paginated_models(
+        db, filters=filters, offset=1, limit=5
+    )
+    assert [model.name for model in models] == ["model0"]
+    assert headers == {"content-range": "items 1-1/2"}
+
+
 def test_model_status(db: Session, created_model, created_dataset):
     # creating
     assert (
@@ -0,0 +1,98 @@
+import struct
+
+import numpy as np
+import pytest
+from geoalchemy2 import RasterElement, WKBElement
+
+from valor_api import schemas
+from valor_api.backend.core.geometry import (
+    _raster_to_png_b64,
+    _wkb_to_polygon_coordinates,
+)
+
+
+def _create_raster_element(
+    mask: np.ndarray, num_bands: int = 1
+) -> RasterElement:
+    """Encodes a boolean mask as a single-band 1BB postgis raster."""
+    height, width = mask.shape
+    header = struct.pack(
+        "<BHHddddddiHH",
+        1,  # ndr
+        0,  # version
+        num_bands,
+        1.0,  # scale_x
+        1.0,  # scale_y
+        0.0,  # ip_x
+        0.0,  # ip_y
+        0.0,  # skew_x
+        0.0,  # skew_y
+        0,  # srid
+        width,
+        height,
+    )
+    band_header = bytes([0x40, 0x00])  # 1BB pixel type, nodata value
+    pixels = mask.astype(np.uint8).tobytes()
+    return RasterElement((header + band_header + pixels).hex())
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (10, 10), (7, 13), (20, 9)])
+def test__raster_to_png_b64(shape: tuple[int, int]):
+    rng = np.random.default_rng(seed=0)
+    mask = rng.random(shape) > 0.5
+
+    encoded = _raster_to_png_b64(
+        raster=_create_raster_element(mask),
+    )
+    raster = schemas.Raster(mask=encoded)
+
+    np.testing.assert_array_equal(raster.to_numpy(), mask)
+
+
+def test__raster_to_png_b64_multiband():
+    with pytest.raises(ValueError):
+        _raster_to_png_b64(
+            raster=_create_raster_element(
+                np.zeros((2, 2), dtype=bool), num_bands=2
+            ),
+        )
+
+
+def _create_polygon_wkb(
+    rings: list[list[tuple[float, float]]],
+    byte_order: str = "<",
+    srid: int | None = None,
+) -> bytes:
+    """Encodes coordinate rings as a (E)WKB polygon."""
+    geometry_type = 3 if srid is None else 3 | 0x20000000
+    wkb = struct.pack(
+        f"{byte_order}BI", 1 if byte_order == "<" else 0, geometry_type
+    )
+    if srid is not None:
+        wkb += struct.pack(f"{byte_order}I", srid)
+    wkb += struct.pack(f"{byte_order}I", len(rings))
+    for ring in rings:
+        wkb += struct.pack(f"{byte_order}I", len(ring))
+        for x, y in ring:
+            wkb += struct.pack(f"{byte_order}dd", x, y)
+    return wkb
+
+
+@pytest.mark.parametrize("byte_order", ["<", ">"])
+@pytest.mark.parametrize("srid", [None, 4326])
+def test__wkb_to_polygon_coordinates(byte_order: str, srid: int | None):
+    rings = [
+        [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0), (0.0, 0.0)],
+        [(2.5, 2.5), (5.0, 2.5), (5.0, 5.0), (2.5, 2.5)],
+    ]
+    wkb = _create_polygon_wkb(rings, byte_order=byte_order, srid=srid)
+
+    assert _wkb_to_polygon_coordinates(WKBElement(wkb)) == rings
+    assert _wkb_to_polygon_coordinates(WKBElement(memoryview(wkb))) == rings
+    assert _wkb_to_polygon_coordinates(WKBElement(wkb.hex())) == rings
+
+
+def test__wkb_to_polygon_coordinates_not_polygon():
+    point = struct.pack("<BIdd", 1, 1, 0.0, 0.0)
+    with pytest.raises(ValueError):
+        _wkb_to_polygon_coordinates(WKBElement(point))
@@ -0,0 +1,27 @@
+from sqlalchemy.orm import Session
+
+from valor_api.backend.database import get_session_cache
+
+
+def test_get_session_cache():
+    db = Session()
+
+    # caches are namespaced and persist within a transaction
+    db.begin()
+    get_session_cache(db, "datasets")["dset"] = 1
+    get_session_cache(db, "models")["model"] = 2
+    assert get_session_cache(db, "datasets") == {"dset": 1}
+    assert get_session_cache(db, "models") == {"model": 2}
+
+    # committing ends the transaction and drops the cache
+    db.commit()
+    assert get_session_cache(db, "datasets") == {}
+    assert get_session_cache(db, "models") == {}
+
+    # rolling back also drops the cache
+    db.begin()
+    get_session_cache(db, "datasets")["dset"] = 1
+    db.rollback()
+    assert get_session_cache(db, "datasets") == {}
+
+    db.close()
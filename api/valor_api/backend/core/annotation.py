@@ -1,11 +1,17 @@
-from geoalchemy2.functions import ST_AsGeoJSON
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
 from sqlalchemy import ScalarSelect, and_, delete, insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from valor_api import schemas
 from valor_api.backend import models
-from valor_api.backend.core.geometry import _raster_to_png_b64
+from valor_api.backend.core.geometry import (
+    _raster_to_png_b64,
+    _wkb_to_polygon_coordinates,
+)
 from valor_api.backend.query import generate_query
 from valor_api.enums import ModelStatus, TableStatus, TaskType
 
@@ -182,6 +188,49 @@ def create_skipped_annotations(
         raise e
 
 
+def _load_annotation_schema(
+    annotation: models.Annotation,
+    labels: list[schemas.Label],
+    embedding: list[float] | None,
+    mask: str | None,
+) -> schemas.Annotation:
+    """Convert database row to schema."""
+
+    # initialize
+    box = None
+    polygon = None
+    raster = None
+
+    # bounding box
+    if annotation.box is not None:
+        box = schemas.Box(
+            value=_wkb_to_polygon_coordinates(annotation.box),
+        )
+
+    # polygon
+    if annotation.polygon is not None:
+        polygon = schemas.Polygon(
+            value=_wkb_to_polygon_coordinates(annotation.polygon),
+        )
+
+    # raster
+    if mask is not None:
+        raster = schemas.Raster(mask=mask)
+
+    return schemas.Annotation(
+        labels=labels,
+        metadata=annotation.meta,
+        bounding_box=box,
+        polygon=polygon,
+        raster=raster,
+        embedding=embedding,
+        text=annotation.text,
+        context_list=annotation.context_list,
+        is_instance=annotation.is_instance,
+        implied_task_types=annotation.implied_task_types,
+    )
+
+
 def get_annotation(
     db: Session,
     annotation: models.Annotation,
@@ -230,36 +279,8 @@ def get_annotation(
             for label in query.all()
         ]
 
-    # initialize
-    box = None
-    polygon = None
-    raster = None
-    embedding = None
-
-    # bounding box
-    if annotation.box is not None:
-        box = schemas.Box.from_json(db.scalar(ST_AsGeoJSON(annotation.box)))
-
-    # polygon
-    if annotation.polygon is not None:
-        polygon = schemas.Polygon.from_json(
-            db.scalar(ST_AsGeoJSON(annotation.polygon))
-        )
-
-    # raster
-    if annotation.raster is not None:
-        datum = db.scalar(
-            select(models.Datum).where(models.Datum.id == annotation.datum_id)
-        )
-        if datum is None:
-            raise RuntimeError(
-                "psql unexpectedly returned None instead of a Datum."
-            )
-        raster = schemas.Raster(
-            mask=_raster_to_png_b64(db=db, raster=annotation.raster),
-        )
-
     # embedding
+    embedding = None
     if annotation.embedding_id:
         embedding = db.scalar(
             select(models.Embedding.value).where(
@@ -267,17 +288,15 @@ def get_annotation(
             )
         )
 
-    return schemas.Annotation(
+    return _load_annotation_schema(
+        annotation=annotation,
         labels=labels,
-        metadata=annotation.meta,
-        bounding_box=box,
-        polygon=polygon,
-        raster=raster,
         embedding=embedding,
-        text=annotation.text,
-        context_list=annotation.context_list,
-        is_instance=annotation.is_instance,
-        implied_task_types=annotation.implied_task_types,
+        mask=(
+            _raster_to_png_b64(raster=annotation.raster)
+            if annotation.raster is not None
+            else None
+        ),
     )
 
 
@@ -289,6 +308,8 @@ def get_annotations(
     """
     Query psql to get all annotations for a particular datum.
 
+    Embeddings are fetched alongside the annotation rows and labels are fetched in a single follow-up query.
+
     Parameters
     -------
     db : Session
@@ -303,23 +324,88 @@ def get_annotations(
     List[schemas.Annotation]
         A list of annotations.
     """
-    model_expr = (
-        models.Annotation.model_id.is_(None)
-        if model is None
-        else models.Annotation.model_id == model.id
-    )
-    return [
-        get_annotation(db, annotation=annotation)
-        for annotation in (
-            db.query(models.Annotation)
-            .where(
-                and_(
-                    model_expr,
-                    models.Annotation.datum_id == datum.id,
-                )
+    if model is None:
+        model_expr = models.Annotation.model_id.is_(None)
+        labels_query = select(
+            models.GroundTruth.annotation_id,
+            models.Label.key,
+            models.Label.value,
+        ).join(models.Label, models.Label.id == models.GroundTruth.label_id)
+        annotation_id_column = models.GroundTruth.annotation_id
+    else:
+        model_expr = models.Annotation.model_id == model.id
+        labels_query = select(
+            models.Prediction.annotation_id,
+            models.Label.key,
+            models.Label.value,
+            models.Prediction.score,
+        ).join(models.Label, models.Label.id == models.Prediction.label_id)
+        annotation_id_column = models.Prediction.annotation_id
+
+    rows = db.execute(
+        select(
+            models.Annotation,
+            models.Embedding.value,
+        )
+        .join(
+            models.Embedding,
+            models.Embedding.id == models.Annotation.embedding_id,
+            isouter=True,
+        )
+        .where(
+            and_(
+                model_expr,
+                models.Annotation.datum_id == datum.id,
             )
-            .all()
         )
+    ).all()
+
+    # fetch the labels of every annotation in one query
+    labels: defaultdict[int, list[schemas.Label]] = defaultdict(list)
+    for annotation_id, key, value, *score in db.execute(
+        labels_query.join(
+            models.Annotation,
+            models.Annotation.id == annotation_id_column,
+        ).where(
+            and_(
+                model_expr,
+                models.Annotation.datum_id == datum.id,
+            )
+        )
+    ):
+        labels[annotation_id].append(
+            schemas.Label(
+                key=key, value=value, score=score[0] if score else None
+            )
+        )
+
+    # encode raster masks concurrently since png compression releases the gil
+    # the pool lives only for this call and is capped at the number of masks
+    # workers only run the db-free encoder so the session stays on this thread
+    rasters = {
+        annotation.id: annotation.raster
+        for annotation, _ in rows
+        if annotation.raster is not None
+    }
+    if len(rasters) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(rasters), os.cpu_count() or 1)
+        ) as executor:
+            encoded = list(executor.map(_raster_to_png_b64, rasters.values()))
+    else:
+        encoded = [
+            _raster_to_png_b64(raster=raster) for raster in rasters.values()
+        ]
+    masks = dict(zip(rasters.keys(), encoded))
+
+    return [
+        _load_annotation_schema(
+            annotation=annotation,
+            labels=labels[annotation.id],
+            embedding=embedding,
+            mask=masks.get(annotation.id),
+        )
+        for annotation, embedding in rows
     ]
 
 
@@ -1,9 +1,10 @@
-from sqlalchemy import and_, delete, desc, func, select
+from sqlalchemy import and_, delete, desc, distinct, func, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
 from valor_api import api_utils, enums, exceptions, schemas
 from valor_api.backend import core, models
+from valor_api.backend.database import get_session_cache
 from valor_api.backend.query import generate_select
 from valor_api.schemas.types import MetadataType
 
@@ -97,6 +98,10 @@ def fetch_dataset(
     exceptions.DatasetDoesNotExistError
         If a dataset with the provided name does not exist.
     """
+    cache = get_session_cache(db, "datasets")
+    if name in cache:
+        return cache[name]
+
     dataset = (
         db.query(models.Dataset)
         .where(
@@ -109,6 +114,7 @@ def fetch_dataset(
     )
     if dataset is None:
         raise exceptions.DatasetDoesNotExistError(name)
+    cache[name] = dataset
     return dataset
 
 
@@ -178,7 +184,12 @@ def get_paginated_datasets(
 
     count = (
         db.query(func.count(models.Dataset.id))
-        .where(models.Dataset.id == datasets_subquery.c.id)
+        .where(
+            and_(
+                models.Dataset.id.in_(select(datasets_subquery.c.id)),
+                models.Dataset.status != enums.TableStatus.DELETING,
+            )
+        )
         .scalar()
     )
 
@@ -192,10 +203,10 @@ def get_paginated_datasets(
         limit = count
 
     datasets = (
-        db.query(models.Dataset)
+        db.query(models.Dataset.name, models.Dataset.meta)
         .where(
             and_(
-                models.Dataset.id == datasets_subquery.c.id,
+                models.Dataset.id.in_(select(datasets_subquery.c.id)),
                 models.Dataset.status != enums.TableStatus.DELETING,
             )
         )
@@ -206,7 +217,7 @@ def get_paginated_datasets(
     )
 
     content = [
-        _load_dataset_schema(db=db, dataset=dataset) for dataset in datasets
+        schemas.Dataset(name=name, metadata=meta) for name, meta in datasets
     ]
 
     headers = api_utils._get_pagination_header(
@@ -300,86 +311,79 @@ def set_dataset_status(
 def get_n_datums_in_dataset(db: Session, name: str) -> int:
     """Returns the number of datums in a dataset."""
     return (
-        db.query(models.Datum)
-        .join(models.Dataset)
+        db.query(func.count(models.Datum.id))
+        .select_from(models.Datum)
+        .join(models.Dataset, models.Dataset.id == models.Datum.dataset_id)
         .where(
             and_(
                 models.Dataset.name == name,
                 models.Dataset.status != enums.TableStatus.DELETING,
             )
         )
-        .count()
+        .scalar()
     )
 
 
 def get_n_groundtruth_annotations(db: Session, name: str) -> int:
     """Returns the number of ground truth annotations in a dataset."""
     return (
-        db.query(models.Annotation)
-        .join(models.GroundTruth)
-        .join(models.Datum)
-        .join(models.Dataset)
+        db.query(func.count(models.Annotation.id))
+        .select_from(models.Annotation)
+        .join(
+            models.GroundTruth,
+            models.GroundTruth.annotation_id == models.Annotation.id,
+        )
+        .join(models.Datum, models.Datum.id == models.Annotation.datum_id)
+        .join(models.Dataset, models.Dataset.id == models.Datum.dataset_id)
         .where(
             and_(
                 models.Dataset.name == name,
                 models.Dataset.status != enums.TableStatus.DELETING,
             )
         )
-        .count()
+        .scalar()
     )
 
 
-def get_n_groundtruth_bounding_boxes_in_dataset(db: Session, name: str) -> int:
+def _get_n_groundtruth_geometries_in_dataset(
+    db: Session, name: str, column: InstrumentedAttribute
+) -> int:
+    """Returns the number of ground truth annotations in a dataset that define the geometry column."""
     return (
-        db.query(models.Annotation.id)
-        .join(models.GroundTruth)
-        .join(models.Datum)
-        .join(models.Dataset)
+        db.query(func.count(distinct(models.Annotation.id)))
+        .select_from(models.Annotation)
+        .join(
+            models.GroundTruth,
+            models.GroundTruth.annotation_id == models.Annotation.id,
+        )
+        .join(models.Datum, models.Datum.id == models.Annotation.datum_id)
+        .join(models.Dataset, models.Dataset.id == models.Datum.dataset_id)
         .where(
             and_(
                 models.Dataset.name == name,
                 models.Dataset.status != enums.TableStatus.DELETING,
-                models.Annotation.box.isnot(None),
+                column.isnot(None),
             )
         )
-        .distinct()
-        .count()
+        .scalar()
+    )
+
+
+def get_n_groundtruth_bounding_boxes_in_dataset(db: Session, name: str) -> int:
+    return _get_n_groundtruth_geometries_in_dataset(
+        db, name, models.Annotation.box
     )
 
 
 def get_n_groundtruth_polygons_in_dataset(db: Session, name: str) -> int:
-    return (
-        db.query(models.Annotation.id)
-        .join(models.GroundTruth)
-        .join(models.Datum)
-        .join(models.Dataset)
-        .where(
-            and_(
-                models.Dataset.name == name,
-                models.Dataset.status != enums.TableStatus.DELETING,
-                models.Annotation.polygon.isnot(None),
-            )
-        )
-        .distinct()
-        .count()
+    return _get_n_groundtruth_geometries_in_dataset(
+        db, name, models.Annotation.polygon
     )
 
 
 def get_n_groundtruth_rasters_in_dataset(db: Session, name: str) -> int:
-    return (
-        db.query(models.Annotation.id)
-        .join(models.GroundTruth)
-        .join(models.Datum)
-        .join(models.Dataset)
-        .where(
-            and_(
-                models.Dataset.name == name,
-                models.Dataset.status != enums.TableStatus.DELETING,
-                models.Annotation.raster.isnot(None),
-            )
-        )
-        .distinct()
-        .count()
+    return _get_n_groundtruth_geometries_in_dataset(
+        db, name, models.Annotation.raster
     )
 
 
@@ -1,4 +1,5 @@
 import warnings
+from collections import defaultdict
 from datetime import timezone
 
 from pydantic import ValidationError
@@ -289,63 +290,13 @@ def _validate_evaluation_filter(
 
 
 def _create_response(
-    db: Session,
     evaluation: models.Evaluation,
+    metrics: list[schemas.Metric],
+    confusion_matrices: list[schemas.ConfusionMatrixResponse],
     **kwargs,
 ) -> schemas.EvaluationResponse:
     """Converts a evaluation row into a response schema."""
 
-    metrics = [
-        schemas.Metric(
-            type=mtype,
-            value=mvalue,
-            label=(
-                schemas.Label(key=lkey, value=lvalue)
-                if lkey and lvalue
-                else None
-            ),
-            parameters=mparam,
-        )
-        for mtype, mvalue, mparam, lkey, lvalue in (
-            db.query(
-                models.Metric.type,
-                models.Metric.value,
-                models.Metric.parameters,
-                models.Label.key,
-                models.Label.value,
-            )
-            .select_from(models.Metric)
-            .join(
-                models.Label,
-                models.Label.id == models.Metric.label_id,
-                isouter=True,
-            )
-            .where(
-                and_(
-                    models.Metric.evaluation_id == evaluation.id,
-                    models.Metric.type.in_(
-                        evaluation.parameters["metrics_to_return"]
-                    ),
-                )
-            )
-            .all()
-        )
-    ]
-
-    confusion_matrices = [
-        schemas.ConfusionMatrixResponse(
-            label_key=matrix.label_key,
-            entries=[
-                schemas.ConfusionMatrixEntry(**entry) for entry in matrix.value
-            ],
-        )
-        for matrix in (
-            db.query(models.ConfusionMatrix)
-            .where(models.ConfusionMatrix.evaluation_id == evaluation.id)
-            .all()
-        )
-    ]
-
     return schemas.EvaluationResponse(
         id=evaluation.id,
         dataset_names=evaluation.dataset_names,
@@ -380,10 +331,75 @@ def _create_responses(
     list[schemas.EvaluationResponse]
         A list of evaluations in response format.
     """
+    if not evaluations:
+        return []
+    elif any(evaluation.id is None for evaluation in evaluations):
+        raise exceptions.EvaluationDoesNotExistError()
+    evaluation_ids = [evaluation.id for evaluation in evaluations]
+
+    # fetch metrics and confusion matrices for all evaluations at once
+    metrics: defaultdict[int, list[schemas.Metric]] = defaultdict(list)
+    for evaluation_id, mtype, mvalue, mparam, lkey, lvalue in db.execute(
+        select(
+            models.Metric.evaluation_id,
+            models.Metric.type,
+            models.Metric.value,
+            models.Metric.parameters,
+            models.Label.key,
+            models.Label.value,
+        )
+        .join(
+            models.Evaluation,
+            models.Evaluation.id == models.Metric.evaluation_id,
+        )
+        .join(
+            models.Label,
+            models.Label.id == models.Metric.label_id,
+            isouter=True,
+        )
+        .where(
+            and_(
+                models.Metric.evaluation_id.in_(evaluation_ids),
+                models.Evaluation.parameters["metrics_to_return"].op("?")(
+                    models.Metric.type
+                ),
+            )
+        )
+    ):
+        metrics[evaluation_id].append(
+            schemas.Metric(
+                type=mtype,
+                value=mvalue,
+                label=(
+                    schemas.Label(key=lkey, value=lvalue)
+                    if lkey and lvalue
+                    else None
+                ),
+                parameters=mparam,
+            )
+        )
+
+    confusion_matrices: defaultdict[
+        int, list[schemas.ConfusionMatrixResponse]
+    ] = defaultdict(list)
+    for evaluation_id, label_key, value in db.execute(
+        select(
+            models.ConfusionMatrix.evaluation_id,
+            models.ConfusionMatrix.label_key,
+            models.ConfusionMatrix.value,
+        ).where(models.ConfusionMatrix.evaluation_id.in_(evaluation_ids))
+    ):
+        confusion_matrices[evaluation_id].append(
+            schemas.ConfusionMatrixResponse(
+                label_key=label_key,
+                entries=[
+                    schemas.ConfusionMatrixEntry(**entry) for entry in value
+                ],
+            )
+        )
+
     results = []
     for evaluation in evaluations:
-        if evaluation.id is None:
-            raise exceptions.EvaluationDoesNotExistError()
 
         parameters = schemas.EvaluationParameters(**evaluation.parameters)
         kwargs = dict()
@@ -436,8 +452,9 @@ def _create_responses(
 
         results.append(
             _create_response(
-                db=db,
                 evaluation=evaluation,
+                metrics=metrics[evaluation.id],
+                confusion_matrices=confusion_matrices[evaluation.id],
                 **kwargs,
             )
         )
@@ -3,15 +3,19 @@ import struct
 from base64 import b64encode
 
 import numpy as np
-from geoalchemy2 import Geometry, RasterElement
+from geoalchemy2 import Geometry, RasterElement, WKBElement
 from geoalchemy2.types import CompositeType
 from PIL import Image
 from sqlalchemy import (
     BinaryExpression,
+    ColumnElement,
     Float,
+    Select,
+    String,
     Update,
-    distinct,
+    bindparam,
     func,
+    lambda_stmt,
     select,
     type_coerce,
     update,
@@ -44,6 +48,47 @@ class RawGeometry(Geometry):
         return col
 
 
+_ANNOTATION_TYPE_HIERARCHY = [
+    (AnnotationType.RASTER, models.Annotation.raster),
+    (AnnotationType.POLYGON, models.Annotation.polygon),
+    (AnnotationType.BOX, models.Annotation.box),
+]
+
+
+def _annotation_type_probe(model_expr: ColumnElement[bool]) -> Select:
+    """
+    Build a statement that checks which geometry columns are populated.
+
+    Dataset and task type are left as bound parameters so the compiled statement can be reused.
+
+    Parameters
+    ----------
+    model_expr : ColumnElement[bool]
+        The filter selecting groundtruth or prediction annotations.
+
+    Returns
+    ----------
+    Select
+        A statement returning one boolean per entry in the annotation type hierarchy.
+    """
+    return select(
+        *[
+            select(models.Annotation.id)
+            .join(models.Datum, models.Datum.id == models.Annotation.datum_id)
+            .where(
+                models.Datum.dataset_id == bindparam("dataset_id"),
+                models.Annotation.implied_task_types.op("?")(
+                    bindparam("task_type", type_=String)
+                ),
+                model_expr,
+                col.isnot(None),
+            )
+            .exists()
+            for _, col in _ANNOTATION_TYPE_HIERARCHY
+        ]
+    )
+
+
 def get_annotation_type(
     db: Session,
     task_type: TaskType,
@@ -69,31 +114,27 @@ def get_annotation_type(
     AnnotationType
         The type of the annotation.
     """
-    model_expr = (
-        models.Annotation.model_id == model.id
-        if model
-        else models.Annotation.model_id.is_(None)
-    )
-    hierarchy = [
-        (AnnotationType.RASTER, models.Annotation.raster),
-        (AnnotationType.POLYGON, models.Annotation.polygon),
-        (AnnotationType.BOX, models.Annotation.box),
-    ]
-    for atype, col in hierarchy:
-        search = (
-            db.query(distinct(models.Dataset.id))
-            .select_from(models.Annotation)
-            .join(models.Datum, models.Datum.id == models.Annotation.datum_id)
-            .join(models.Dataset, models.Dataset.id == models.Datum.dataset_id)
-            .where(
-                models.Datum.dataset_id == dataset.id,
-                models.Annotation.implied_task_types.op("?")(task_type.value),
-                model_expr,
-                col.isnot(None),
-            )
-            .one_or_none()
+    # probe every geometry column in a single round trip
+    if model is None:
+        stmt = lambda_stmt(
+            lambda: _annotation_type_probe(
+                models.Annotation.model_id.is_(None)
+            ),
+            track_closure_variables=False,
+        )
+    else:
+        stmt = lambda_stmt(
+            lambda: _annotation_type_probe(
+                models.Annotation.model_id == bindparam("model_id")
+            ),
+            track_closure_variables=False,
         )
-        if search is not None:
+    params = {"dataset_id": dataset.id, "task_type": task_type.value}
+    if model is not None:
+        params["model_id"] = model.id
+    found = db.execute(stmt, params).one()
+    for (atype, _), exists in zip(_ANNOTATION_TYPE_HIERARCHY, found):
+        if exists:
             return atype
     return AnnotationType.NONE
 
@@ -313,7 +354,6 @@ def convert_geometry(
 
 
 def _raster_to_png_b64(
-    db: Session,
     raster: RasterElement,
 ) -> str:
     """
@@ -321,9 +361,7 @@ def _raster_to_png_b64(
 
     Parameters
     ----------
-    db : Session
-        The database session.
-    raster : Image.Image
+    raster : RasterElement
         The raster in bytes.
 
     Returns
@@ -357,28 +395,74 @@ def _raster_to_png_b64(
     if num_bands != 1:
         raise ValueError("This function only supports single-band rasters.")
 
-    # Calculate the number of bytes needed for the pixel data
+    # View the pixel data as a numpy array without unpacking it into Python ints
     # Each byte represents 1 pixel
-    num_pixels = width * height
-    num_bytes = num_pixels
-
-    # Convert the byte data to a binary array
-    pixel_format = "B"
-    pixel_data = struct.unpack(
-        f"{width * height}{pixel_format}",
-        raster_wkb[header_size + 2 : header_size + 2 + num_bytes],
+    raster_numpy = np.frombuffer(
+        raster_wkb,
+        dtype=np.uint8,
+        count=width * height,
+        offset=header_size + 2,
     )
-
-    # Convert pixel data to numpy array
-    raster_numpy = np.array(pixel_data, dtype=bool)
     raster_numpy = raster_numpy.reshape((height, width))
 
-    # Convert to Pillow Image
-    raster_image = Image.fromarray(raster_numpy)
+    # Pack to 1-bit rows and load them directly as a mode "1" image
+    raster_image = Image.frombytes(
+        "1", (width, height), np.packbits(raster_numpy, axis=1).tobytes()
+    )
 
-    # b64 encode PNG to mask str
+    # b64 encode PNG to mask str, reading the buffer in place instead of copying it
     f = io.BytesIO()
-    raster_image.save(f, format="PNG")
-    f.seek(0)
-    mask_bytes = f.read()
-    return b64encode(mask_bytes).decode()
+    raster_image.save(f, format="PNG", compress_level=1)
+    return b64encode(f.getbuffer()).decode()
+
+
+def _wkb_to_polygon_coordinates(
+    geometry: WKBElement,
+) -> list[list[tuple[float, float]]]:
+    """
+    Convert a polygon in (E)WKB format into its list of coordinate rings.
+
+    Parameters
+    ----------
+    geometry : WKBElement
+        The polygon in (E)WKB format.
+
+    Returns
+    -------
+    list[list[tuple[float, float]]]
+        The exterior ring followed by any interior rings.
+    """
+    data = geometry.data
+    wkb = bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+
+    # Unpack header to get the geometry type
+    # reference: https://libgeos.org/specifications/wkb/
+    byte_order = "<" if wkb[0] == 1 else ">"
+    (geometry_type,) = struct.unpack_from(f"{byte_order}I", wkb, 1)
+    offset = 5
+
+    # Skip the srid if this is extended wkb
+    if geometry_type & 0x20000000:
+        geometry_type &= ~0x20000000
+        offset += 4
+
+    # Check if the geometry is a 2D polygon
+    if geometry_type != 3:
+        raise ValueError("This function only supports 2D polygons.")
+
+    (num_rings,) = struct.unpack_from(f"{byte_order}I", wkb, offset)
+    offset += 4
+
+    rings = []
+    for _ in range(num_rings):
+        (num_points,) = struct.unpack_from(f"{byte_order}I", wkb, offset)
+        offset += 4
+        points = np.frombuffer(
+            wkb,
+            dtype=f"{byte_order}f8",
+            count=2 * num_points,
+            offset=offset,
+        ).reshape((num_points, 2))
+        offset += points.nbytes
+        rings.append([(x, y) for x, y in points.tolist()])
+    return rings
@@ -342,7 +342,7 @@ def get_paginated_labels(
             "Offset should be an int greater than or equal to zero. Limit should be an int greater than or equal to -1."
         )
 
-    count = len(query.distinct().all())
+    count = query.distinct().count()
 
     if offset > count:
         raise ValueError(
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from valor_api import api_utils, exceptions, schemas
 from valor_api.backend import core, models
+from valor_api.backend.database import get_session_cache
 from valor_api.backend.query import generate_select
 from valor_api.enums import ModelStatus, TableStatus
 
@@ -120,11 +121,16 @@ def fetch_model(
     exceptions.ModelDoesNotExistError
         If a model with the provided name does not exist.
     """
+    cache = get_session_cache(db, "models")
+    if name in cache:
+        return cache[name]
+
     model = (
         db.query(models.Model).where(models.Model.name == name).one_or_none()
     )
     if model is None:
         raise exceptions.ModelDoesNotExistError(name)
+    cache[name] = model
     return model
 
 
@@ -190,7 +196,7 @@ def get_paginated_models(
 
     count = (
         db.query(func.count(models.Model.id))
-        .where(models.Model.id == subquery.c.id)
+        .where(models.Model.id.in_(select(subquery.c.id)))
         .scalar()
     )
 
@@ -204,15 +210,17 @@ def get_paginated_models(
         limit = count
 
     models_ = (
-        db.query(models.Model)
-        .where(models.Model.id == subquery.c.id)
+        db.query(models.Model.name, models.Model.meta)
+        .where(models.Model.id.in_(select(subquery.c.id)))
         .order_by(desc(models.Model.created_at))
         .offset(offset)
         .limit(limit)
         .all()
     )
 
-    content = [_load_model_schema(db=db, model=model) for model in models_]
+    content = [
+        schemas.Model(name=name, metadata=meta) for name, meta in models_
+    ]
 
     headers = api_utils._get_pagination_header(
         offset=offset,
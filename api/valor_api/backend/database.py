@@ -3,7 +3,7 @@ import time
 from typing import Callable
 
 import psycopg2
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.sql import text
@@ -25,6 +25,35 @@ logger.debug(
 
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
 
+_SESSION_CACHE_KEY = "valor_cache"
+
+
+def get_session_cache(db: Session, namespace: str) -> dict:
+    """
+    Returns a cache that lives for the duration of the session's current transaction.
+
+    Entries are dropped whenever the transaction ends (commit, rollback or close) so
+    cached rows never outlive the state they were read from.
+
+    Parameters
+    ----------
+    db : Session
+        The database session.
+    namespace : str
+        The name of the cache within the session.
+
+    Returns
+    -------
+    dict
+        A mutable cache.
+    """
+    return db.info.setdefault(_SESSION_CACHE_KEY, {}).setdefault(namespace, {})
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_session_cache(session: Session, transaction) -> None:
+    session.info.pop(_SESSION_CACHE_KEY, None)
+
 
 def vacuum_analyze():
     """
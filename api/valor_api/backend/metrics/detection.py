@@ -831,6 +831,21 @@ def _convert_annotations_to_common_type(
     return target_type
 
 
+def _annotation_type_to_column(
+    annotation_type: AnnotationType,
+    table,
+):
+    match annotation_type:
+        case AnnotationType.BOX:
+            return table.box
+        case AnnotationType.POLYGON:
+            return table.polygon
+        case AnnotationType.RASTER:
+            return table.raster
+        case _:
+            raise RuntimeError
+
+
 def _annotation_type_to_geojson(
     annotation_type: AnnotationType,
     table,
@@ -1026,20 +1041,6 @@ def _compute_detection_metrics(
 
     """
 
-    def _annotation_type_to_column(
-        annotation_type: AnnotationType,
-        table,
-    ):
-        match annotation_type:
-            case AnnotationType.BOX:
-                return table.box
-            case AnnotationType.POLYGON:
-                return table.polygon
-            case AnnotationType.RASTER:
-                return table.raster
-            case _:
-                raise RuntimeError
-
     if (
         parameters.iou_thresholds_to_return is None
         or parameters.iou_thresholds_to_compute is None
@@ -1452,20 +1453,6 @@ def _compute_detection_metrics_with_detailed_precision_recall_curve(
 
     """
 
-    def _annotation_type_to_column(
-        annotation_type: AnnotationType,
-        table,
-    ):
-        match annotation_type:
-            case AnnotationType.BOX:
-                return table.box
-            case AnnotationType.POLYGON:
-                return table.polygon
-            case AnnotationType.RASTER:
-                return table.raster
-            case _:
-                raise RuntimeError
-
     if (
         parameters.iou_thresholds_to_return is None
         or parameters.iou_thresholds_to_compute is None
@@ -1025,10 +1025,11 @@ class Raster(BaseModel):
             A valid input to the models.Annotation.raster column.
         """
         if self.geometry:
+            height, width = self.array.shape
             empty_raster = ST_AddBand(
                 ST_MakeEmptyRaster(
-                    self.width,  # width
-                    self.height,  # height
+                    width,  # width
+                    height,  # height
                     0,  # upperleftx
                     0,  # upperlefty
                     1,  # scalex